@@ -0,0 +1,18 @@
+"""
+Gunicorn configuration for the PresQT Django application.
+
+The application is loaded in the master process before the workers are forked so every worker
+shares the already imported modules instead of importing them again itself.
+"""
+
+preload_app = True
+
+
+def when_ready(server):
+    """
+    Import every target's functions, and with them their HTTP client libraries, in the master
+    process before any workers are spawned.
+    """
+    from presqt.api_v1.utilities import FunctionRouter
+
+    FunctionRouter.load_all_functions()
@@ -1,11 +1,9 @@
-from rest_framework.renderers import JSONRenderer
 from rest_framework.reverse import reverse
-from rest_framework.decorators import api_view, renderer_classes
+from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
 
 @api_view(['GET'])
-@renderer_classes([JSONRenderer])
 def api_root(request, format=None):
     """
     Overview of available resources in this API.
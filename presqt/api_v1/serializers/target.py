@@ -1,7 +1,6 @@
-from django.urls import reverse
 from rest_framework import serializers
 
-from presqt.api_v1.utilities import action_checker, link_builder
+from presqt.api_v1.utilities import action_checker, link_builder, url_template
 from presqt.utilities import list_intersection
 
 
@@ -19,6 +18,10 @@ class SupportedActions(serializers.Serializer):
     keywords_upload = serializers.BooleanField()
 
 
+# The supported_actions keys, in the order they are displayed on the API
+_SUPPORTED_ACTIONS = tuple(SupportedActions().fields)
+
+
 class SupportedTransferPartners(serializers.Serializer):
     """
     Serializer for supported_transfer_partners objects inside the Target JSON.
@@ -27,38 +30,43 @@ class SupportedTransferPartners(serializers.Serializer):
     transfer_out = serializers.ListField(child=serializers.CharField())
 
 
-class TargetsSerializer(serializers.Serializer):
-    """
-    Serializer for multiple Target objects.
+def serialize_target_list(target_dicts, request):
     """
-    name = serializers.CharField(max_length=256)
-    readable_name = serializers.CharField(max_length=256)
-    status_url = serializers.CharField(max_length=256)
-    token_url = serializers.CharField(max_length=256)
-    supported_actions = SupportedActions()
-    supported_transfer_partners = SupportedTransferPartners()
-    supported_hash_algorithms = serializers.StringRelatedField(many=True)
-    infinite_depth = serializers.BooleanField()
-    search_parameters = serializers.ListField()
-    links = serializers.SerializerMethodField()
+    Build the representation of multiple Target objects.
 
-    def get_links(self, instance):
-        """
-        Translate the `links` property to a custom array of Hyperlink values.
-
-        Parameters
-        ----------
-        instance : Target Obj instance
+    The Target JSON is already a list of plain dictionaries so the representation is built
+    directly rather than going through a DRF serializer for every Target.
 
-        Returns
-        -------
-        A list of hyperlink urls for Target detail API endpoint
-        """
-        reversed_target_detail = reverse(
-            'target', kwargs={'target_name': instance['name']})
+    Parameters
+    ----------
+    target_dicts : list
+        List of Target dictionaries from targets.json
+    request : HTTP Request Object
 
-        return [{"name": 'Detail', "link": self.context['request'].build_absolute_uri(
-            reversed_target_detail), "method": "GET"}]
+    Returns
+    -------
+    A list of Target dictionaries with a hyperlink to each Target detail API endpoint
+    """
+    build_absolute_uri = request.build_absolute_uri
+    detail_template = url_template('target', 'target_name')
+
+    return [{
+        'name': target['name'],
+        'readable_name': target['readable_name'],
+        'status_url': target['status_url'],
+        'token_url': target['token_url'],
+        'supported_actions': {
+            action: target['supported_actions'][action] for action in _SUPPORTED_ACTIONS},
+        'supported_transfer_partners': {
+            'transfer_in': target['supported_transfer_partners']['transfer_in'],
+            'transfer_out': target['supported_transfer_partners']['transfer_out']},
+        'supported_hash_algorithms': target['supported_hash_algorithms'],
+        'infinite_depth': target['infinite_depth'],
+        'search_parameters': target['search_parameters'],
+        'links': [{"name": 'Detail',
+                   "link": build_absolute_uri(detail_template.format(target['name'])),
+                   "method": "GET"}]
+    } for target in target_dicts]
 
 
 class TargetSerializer(serializers.Serializer):
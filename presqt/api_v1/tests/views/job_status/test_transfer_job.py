@@ -621,25 +621,16 @@ class TestTransferJobGET(SimpleTestCase):
 
     def test_get_error_500_500_server_error_download(self):
         """
-        Return a 500 if the BaseResource._transfer_resource function running on the server gets a
-        500 error because the GitHub server is down when attempting to transfer a project.
+        Return the download error if the BaseResource._transfer_resource function running on the
+        server can't download the source resource when attempting to transfer a project.
         """
-        class MockResponse:
-            def __init__(self, json_data, status_code):
-                self.json_data = json_data
-                self.status_code = status_code
-        mock_req = MockResponse({'error': 'The server is down.'}, 500)
-
-        # Mock the Session POST request to return a 500 server error when creating the project
-        with patch('presqt.targets.github.functions.download.github_download_resource') as mock_request:
-            mock_request.return_value = mock_req
-            # Attempt to create the project (but the server is down from our mock!)
-            response = self.client.post(self.url, {
-                "source_target_name": "github",
-                "source_resource_id": "garbage_id", "keywords": []},
-                **self.headers, format='json')
-            process_info_path = 'mediafiles/jobs/{}/process_info.json'.format(self.ticket_number)
-            process_info = read_file(process_info_path, True)
+        # Attempt to transfer a resource that doesn't exist on GitHub
+        response = self.client.post(self.url, {
+            "source_target_name": "github",
+            "source_resource_id": "garbage_id", "keywords": []},
+            **self.headers, format='json')
+        process_info_path = 'mediafiles/jobs/{}/process_info.json'.format(self.ticket_number)
+        process_info = read_file(process_info_path, True)
 
         while process_info['resource_transfer_in']['status'] == 'in_progress':
             try:
@@ -648,7 +639,7 @@ class TestTransferJobGET(SimpleTestCase):
                 # Pass while the process_info file is being written to
                 pass
 
-        # Check in on the transfer job and verify we got the 500 for the server error
+        # Check in on the transfer job and verify we got the error from the download
         url = reverse('job_status', kwargs={'action': 'transfer'})
         response = self.client.get(url, **self.headers)
 
@@ -673,20 +664,22 @@ class TestTransferJobGET(SimpleTestCase):
         """
         If a transfer target doesn't allow transfer from the source, an error message is displayed.
         """
-        json_file = open('presqt/api_v1/tests/resources/transfer_targets_test.json')
+        test_targets = {data['name']: data for data in read_file(
+            'presqt/api_v1/tests/resources/transfer_targets_test.json', True)}
 
-        with patch("builtins.open") as mock_file:
-            mock_file.return_value = json_file
+        with patch.dict('presqt.api_v1.utilities.validation.target_validation._TARGETS',
+                        test_targets, clear=True):
             self.assertRaises(PresQTValidationError, transfer_target_validation, 'github', 'osf')
 
     def test_transfer_out_targets_not_allowed(self):
         """
         If a transfer target doesn't allow transfer to the source, an error message is displayed.
         """
-        json_file = open('presqt/api_v1/tests/resources/transfer_targets_test.json')
+        test_targets = {data['name']: data for data in read_file(
+            'presqt/api_v1/tests/resources/transfer_targets_test.json', True)}
 
-        with patch("builtins.open") as mock_file:
-            mock_file.return_value = json_file
+        with patch.dict('presqt.api_v1.utilities.validation.target_validation._TARGETS',
+                        test_targets, clear=True):
             self.assertRaises(PresQTValidationError, transfer_target_validation, 'osf', 'github')
 
     def test_get_error_500_400_metadata_file(self):
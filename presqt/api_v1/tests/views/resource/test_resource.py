@@ -61,18 +61,19 @@ class TestResourceGET(SimpleTestCase):
         Return a 400 if the GET method fails because the target requested does not support
         this endpoint's action.
         """
-        with open('presqt/api_v1/tests/resources/targets_test.json') as json_file:
-            with patch("builtins.open") as mock_file:
-                mock_file.return_value = json_file
-                url = reverse('resource', kwargs={'target_name': 'test',
-                                                  'resource_id': 'cmn5z',
-                                                  'resource_format': 'json'})
-                response = self.client.get(url, **self.header)
-                # Verify the error status code and message
-                self.assertEqual(response.status_code, 400)
-                self.assertEqual(
-                    response.data,
-                    {'error': "PresQT Error: 'test' does not support the action 'resource_detail'."})
+        test_targets = {data['name']: data for data in read_file(
+            'presqt/api_v1/tests/resources/targets_test.json', True)}
+        with patch.dict('presqt.api_v1.utilities.validation.target_validation._TARGETS',
+                        test_targets, clear=True):
+            url = reverse('resource', kwargs={'target_name': 'test',
+                                              'resource_id': 'cmn5z',
+                                              'resource_format': 'json'})
+            response = self.client.get(url, **self.header)
+            # Verify the error status code and message
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(
+                response.data,
+                {'error': "PresQT Error: 'test' does not support the action 'resource_detail'."})
 
     def test_error_404_bad_target_name(self):
         """
@@ -105,19 +106,20 @@ class TestResourceGETZip(SimpleTestCase):
         Return a 400 if the GET method fails because the target requested does not support
         this endpoint's action.
         """
-        with open('presqt/api_v1/tests/resources/targets_test.json') as json_file:
-            with patch("builtins.open") as mock_file:
-                mock_file.return_value = json_file
-                url = reverse(
-                    'resource', kwargs={'target_name': 'test',
-                                        'resource_id': '5cd98510f244ec001fe5632f',
-                                        'resource_format': 'zip'})
-                response = self.client.get(url, **self.header)
-                # Verify the error status code and message
-                self.assertEqual(response.status_code, 400)
-                self.assertEqual(
-                    response.data,
-                    {'error': "PresQT Error: 'test' does not support the action 'resource_download'."})
+        test_targets = {data['name']: data for data in read_file(
+            'presqt/api_v1/tests/resources/targets_test.json', True)}
+        with patch.dict('presqt.api_v1.utilities.validation.target_validation._TARGETS',
+                        test_targets, clear=True):
+            url = reverse(
+                'resource', kwargs={'target_name': 'test',
+                                    'resource_id': '5cd98510f244ec001fe5632f',
+                                    'resource_format': 'zip'})
+            response = self.client.get(url, **self.header)
+            # Verify the error status code and message
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(
+                response.data,
+                {'error': "PresQT Error: 'test' does not support the action 'resource_download'."})
 
     def test_error_404_bad_target_name(self):
         """
@@ -240,16 +242,17 @@ class TestResourcePOSTWithFile(SimpleTestCase):
         """
         file = open('presqt/api_v1/tests/resources/upload/ProjectBagItToUpload.zip', 'rb')
 
-        with open('presqt/api_v1/tests/resources/targets_test.json') as json_file:
-            with patch("builtins.open") as mock_file:
-                mock_file.return_value = json_file
-                url = reverse('resource', kwargs={
-                              'target_name': 'test', 'resource_id': 'resource_id'})
-                response = self.client.post(url, {'presqt-file': file}, **self.headers)
-                # Verify the error status code and message
-                self.assertEqual(response.status_code, 400)
-                self.assertEqual(
-                    response.data, {'error': "PresQT Error: 'test' does not support the action 'resource_upload'."})
+        test_targets = {data['name']: data for data in read_file(
+            'presqt/api_v1/tests/resources/targets_test.json', True)}
+        with patch.dict('presqt.api_v1.utilities.validation.target_validation._TARGETS',
+                        test_targets, clear=True):
+            url = reverse('resource', kwargs={
+                          'target_name': 'test', 'resource_id': 'resource_id'})
+            response = self.client.post(url, {'presqt-file': file}, **self.headers)
+            # Verify the error status code and message
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(
+                response.data, {'error': "PresQT Error: 'test' does not support the action 'resource_upload'."})
 
     def test_error_400_missing_token(self):
         """
@@ -541,10 +544,11 @@ class TestResourcePOSTWithBody(SimpleTestCase):
         Return a 400 if the POST method fails because the destination_target_name requested does not supported
         this endpoint's action
         """
-        json_file = open('presqt/api_v1/tests/resources/targets_test.json')
+        test_targets = {data['name']: data for data in read_file(
+            'presqt/api_v1/tests/resources/targets_test.json', True)}
 
-        with patch("builtins.open") as mock_file:
-            mock_file.return_value = json_file
+        with patch.dict('presqt.api_v1.utilities.validation.target_validation._TARGETS',
+                        test_targets, clear=True):
             url = reverse('resource',
                           kwargs={'target_name': 'test', 'resource_id': 'resource_id'})
             response = self.client.post(url, {
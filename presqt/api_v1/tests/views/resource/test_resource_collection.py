@@ -6,6 +6,7 @@ from rest_framework.test import APIClient
 
 from config.settings.base import OSF_TEST_USER_TOKEN
 from presqt.api_v1.utilities import get_action_message
+from presqt.utilities import read_file
 
 
 class TestResourceCollection(SimpleTestCase):
@@ -36,17 +37,18 @@ class TestResourceCollection(SimpleTestCase):
         Return a 400 if the GET method fails because the target requested does not support
         this endpoint's action.
         """
-        with open('presqt/api_v1/tests/resources/targets_test.json') as json_file:
-            with patch("builtins.open") as mock_file:
-                mock_file.return_value = json_file
-                url = reverse('resource_collection', kwargs={
-                              'target_name': 'test'})
-                response = self.client.get(url, **self.header)
-                # Verify the error status code and message
-                self.assertEqual(response.status_code, 400)
-                self.assertEqual(
-                    response.data,
-                    {'error': "PresQT Error: 'test' does not support the action 'resource_collection'."})
+        test_targets = {data['name']: data for data in read_file(
+            'presqt/api_v1/tests/resources/targets_test.json', True)}
+        with patch.dict('presqt.api_v1.utilities.validation.target_validation._TARGETS',
+                        test_targets, clear=True):
+            url = reverse('resource_collection', kwargs={
+                          'target_name': 'test'})
+            response = self.client.get(url, **self.header)
+            # Verify the error status code and message
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(
+                response.data,
+                {'error': "PresQT Error: 'test' does not support the action 'resource_collection'."})
 
     def test_get_error_404_bad_target_name(self):
         """
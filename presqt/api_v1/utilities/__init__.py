@@ -8,6 +8,7 @@ from presqt.api_v1.utilities.multiprocess.spawn_action_process import spawn_acti
 from presqt.api_v1.utilities.utils.get_action_message import get_action_message
 from presqt.api_v1.utilities.utils.get_target_data import get_target_data
 from presqt.api_v1.utilities.utils.function_router import FunctionRouter
+from presqt.api_v1.utilities.utils.url_template import url_template
 from presqt.api_v1.utilities.utils.target_actions import (
     action_checker, link_builder)
 from presqt.api_v1.utilities.metadata.create_fts_metadata import create_fts_metadata
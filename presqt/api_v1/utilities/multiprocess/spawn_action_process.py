@@ -1,7 +1,13 @@
 import multiprocessing
 
+from django.db import connections
+
 from presqt.api_v1.utilities.multiprocess.watchdog import process_watchdog
 
+# Fork the action processes so they inherit the already imported Django app instead of
+# re-importing it the way the 'spawn' start method would.
+_FORK_CONTEXT = multiprocessing.get_context('fork')
+
 
 def spawn_action_process(self, method_to_call, action):
     """
@@ -15,14 +21,17 @@ def spawn_action_process(self, method_to_call, action):
     method_to_call: class method
         Method to spawn
     """
+    # Don't let the forked processes share any open database connections with the request
+    connections.close_all()
+
     # Spawn job separate from request memory thread
-    function_process = multiprocessing.Process(target=method_to_call)
+    function_process = _FORK_CONTEXT.Process(target=method_to_call)
     # Add the process obj to the base class so we can write the process id in the target function
     self.function_process = function_process
     function_process.start()
 
     # Start the watchdog process that will monitor the spawned off process
-    watch_dog = multiprocessing.Process(target=process_watchdog,
-                                        args=(function_process, self.process_info_path, 3600, action))
+    watch_dog = _FORK_CONTEXT.Process(target=process_watchdog,
+                                      args=(function_process, self.process_info_path, 3600, action))
     self.watch_dog = watch_dog
     watch_dog.start()
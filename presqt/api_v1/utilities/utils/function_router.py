@@ -1,111 +1,102 @@
-from presqt.targets.github.functions.fetch import github_fetch_resources, github_fetch_resource
-from presqt.targets.github.functions.download import github_download_resource
-from presqt.targets.github.functions.upload import github_upload_resource
-from presqt.targets.github.functions.upload_metadata import github_upload_metadata
-from presqt.targets.github.functions.keywords import github_fetch_keywords, github_upload_keywords
-
-from presqt.targets.curate_nd.functions.fetch import (
-    curate_nd_fetch_resources, curate_nd_fetch_resource)
-from presqt.targets.curate_nd.functions.download import curate_nd_download_resource
-from presqt.targets.curate_nd.functions.keywords import curate_nd_fetch_keywords
-
-from presqt.targets.osf.functions.fetch import osf_fetch_resources, osf_fetch_resource
-from presqt.targets.osf.functions.download import osf_download_resource
-from presqt.targets.osf.functions.upload import osf_upload_resource
-from presqt.targets.osf.functions.upload_metadata import osf_upload_metadata
-from presqt.targets.osf.functions.keywords import osf_fetch_keywords, osf_upload_keywords
-
-from presqt.targets.zenodo.functions.fetch import zenodo_fetch_resources, zenodo_fetch_resource
-from presqt.targets.zenodo.functions.download import zenodo_download_resource
-from presqt.targets.zenodo.functions.upload import zenodo_upload_resource
-from presqt.targets.zenodo.functions.upload_metadata import zenodo_upload_metadata
-from presqt.targets.zenodo.functions.keywords import zenodo_fetch_keywords, zenodo_upload_keywords
-
-from presqt.targets.gitlab.functions.fetch import gitlab_fetch_resources, gitlab_fetch_resource
-from presqt.targets.gitlab.functions.download import gitlab_download_resource
-from presqt.targets.gitlab.functions.upload import gitlab_upload_resource
-from presqt.targets.gitlab.functions.upload_metadata import gitlab_upload_metadata
-from presqt.targets.gitlab.functions.keywords import gitlab_fetch_keywords, gitlab_upload_keywords
-
-from presqt.targets.figshare.functions.fetch import figshare_fetch_resources, figshare_fetch_resource
-from presqt.targets.figshare.functions.download import figshare_download_resource
-from presqt.targets.figshare.functions.upload import figshare_upload_resource
-from presqt.targets.figshare.functions.upload_metadata import figshare_upload_metadata
-from presqt.targets.figshare.functions.keywords import figshare_fetch_keywords, figshare_upload_keywords
+import importlib
 
 
 class FunctionRouter(object):
     """
     This class acts as a router to allow dynamic function calls based on a given variable.
 
-    Each attribute links to a function. Naming conventions are important. They must match the keys
-    we keep in the target.json config file. They are as follows:
+    Each route is keyed by a (target_name, action) tuple and links to a function, given as a
+    'module.path:function_name' string. Target modules are only imported the first time one of
+    their functions is requested. Naming conventions are important. The actions must match the
+    keys we keep in the target.json config file. They are as follows:
 
     Target Resources Collection:
-        {target_name}_resource_collection
+        ({target_name}, resource_collection)
 
     Target Resource Detail:
-        {target_name}_resource_detail
+        ({target_name}, resource_detail)
 
     Target Resource Download:
-        {target_name}_resource_download
+        ({target_name}, resource_download)
 
     Target Resource Upload:
-        {target_name}_resource_upload
+        ({target_name}, resource_upload)
 
     Target Resource FTS Metadata Upload:
-        {target_name}_metadata_upload
+        ({target_name}, metadata_upload)
 
     """
     @classmethod
     def get_function(cls, target_name, action):
         """
-        Extracts the getattr() function call to this class method so the code using this class
-        is easier to work with.
+        Look up the function for the given target and action in the routes dictionary so the
+        code using this class is easier to work with.
+
+        The target module is imported on first use and cached. The function itself is looked up
+        on the module every call so it always matches the module's current attribute.
+        """
+        module_path, function_name = cls._ROUTES[(target_name, action)].split(':')
+        try:
+            module = cls._LOADED[module_path]
+        except KeyError:
+            module = cls._LOADED[module_path] = importlib.import_module(module_path)
+
+        return getattr(module, function_name)
+
+    @classmethod
+    def load_all_functions(cls):
+        """
+        Import every route's module up front. Used by the gunicorn master process so forked
+        workers inherit the already imported target modules.
         """
-        return getattr(cls, '{}_{}'.format(target_name, action))
-
-    osf_resource_collection = osf_fetch_resources
-    osf_resource_detail = osf_fetch_resource
-    osf_resource_download = osf_download_resource
-    osf_resource_upload = osf_upload_resource
-    osf_metadata_upload = osf_upload_metadata
-    osf_keywords = osf_fetch_keywords
-    osf_keywords_upload = osf_upload_keywords
-
-    curate_nd_resource_collection = curate_nd_fetch_resources
-    curate_nd_resource_detail = curate_nd_fetch_resource
-    curate_nd_resource_download = curate_nd_download_resource
-    curate_nd_keywords = curate_nd_fetch_keywords
-
-    github_resource_collection = github_fetch_resources
-    github_resource_detail = github_fetch_resource
-    github_resource_download = github_download_resource
-    github_resource_upload = github_upload_resource
-    github_metadata_upload = github_upload_metadata
-    github_keywords = github_fetch_keywords
-    github_keywords_upload = github_upload_keywords
-
-    zenodo_resource_collection = zenodo_fetch_resources
-    zenodo_resource_detail = zenodo_fetch_resource
-    zenodo_resource_download = zenodo_download_resource
-    zenodo_resource_upload = zenodo_upload_resource
-    zenodo_metadata_upload = zenodo_upload_metadata
-    zenodo_keywords = zenodo_fetch_keywords
-    zenodo_keywords_upload = zenodo_upload_keywords
-
-    gitlab_resource_collection = gitlab_fetch_resources
-    gitlab_resource_detail = gitlab_fetch_resource
-    gitlab_resource_download = gitlab_download_resource
-    gitlab_resource_upload = gitlab_upload_resource
-    gitlab_metadata_upload = gitlab_upload_metadata
-    gitlab_keywords = gitlab_fetch_keywords
-    gitlab_keywords_upload = gitlab_upload_keywords
-
-    figshare_resource_collection = figshare_fetch_resources
-    figshare_resource_detail = figshare_fetch_resource
-    figshare_resource_download = figshare_download_resource
-    figshare_resource_upload = figshare_upload_resource
-    figshare_metadata_upload = figshare_upload_metadata
-    figshare_keywords = figshare_fetch_keywords
-    figshare_keywords_upload = figshare_upload_keywords
\ No newline at end of file
+        for target_name, action in list(cls._ROUTES):
+            cls.get_function(target_name, action)
+
+    _LOADED = {}
+
+    _ROUTES = {
+        ('osf', 'resource_collection'): 'presqt.targets.osf.functions.fetch:osf_fetch_resources',
+        ('osf', 'resource_detail'): 'presqt.targets.osf.functions.fetch:osf_fetch_resource',
+        ('osf', 'resource_download'): 'presqt.targets.osf.functions.download:osf_download_resource',
+        ('osf', 'resource_upload'): 'presqt.targets.osf.functions.upload:osf_upload_resource',
+        ('osf', 'metadata_upload'): 'presqt.targets.osf.functions.upload_metadata:osf_upload_metadata',
+        ('osf', 'keywords'): 'presqt.targets.osf.functions.keywords:osf_fetch_keywords',
+        ('osf', 'keywords_upload'): 'presqt.targets.osf.functions.keywords:osf_upload_keywords',
+
+        ('curate_nd', 'resource_collection'): 'presqt.targets.curate_nd.functions.fetch:curate_nd_fetch_resources',
+        ('curate_nd', 'resource_detail'): 'presqt.targets.curate_nd.functions.fetch:curate_nd_fetch_resource',
+        ('curate_nd', 'resource_download'): 'presqt.targets.curate_nd.functions.download:curate_nd_download_resource',
+        ('curate_nd', 'keywords'): 'presqt.targets.curate_nd.functions.keywords:curate_nd_fetch_keywords',
+
+        ('github', 'resource_collection'): 'presqt.targets.github.functions.fetch:github_fetch_resources',
+        ('github', 'resource_detail'): 'presqt.targets.github.functions.fetch:github_fetch_resource',
+        ('github', 'resource_download'): 'presqt.targets.github.functions.download:github_download_resource',
+        ('github', 'resource_upload'): 'presqt.targets.github.functions.upload:github_upload_resource',
+        ('github', 'metadata_upload'): 'presqt.targets.github.functions.upload_metadata:github_upload_metadata',
+        ('github', 'keywords'): 'presqt.targets.github.functions.keywords:github_fetch_keywords',
+        ('github', 'keywords_upload'): 'presqt.targets.github.functions.keywords:github_upload_keywords',
+
+        ('zenodo', 'resource_collection'): 'presqt.targets.zenodo.functions.fetch:zenodo_fetch_resources',
+        ('zenodo', 'resource_detail'): 'presqt.targets.zenodo.functions.fetch:zenodo_fetch_resource',
+        ('zenodo', 'resource_download'): 'presqt.targets.zenodo.functions.download:zenodo_download_resource',
+        ('zenodo', 'resource_upload'): 'presqt.targets.zenodo.functions.upload:zenodo_upload_resource',
+        ('zenodo', 'metadata_upload'): 'presqt.targets.zenodo.functions.upload_metadata:zenodo_upload_metadata',
+        ('zenodo', 'keywords'): 'presqt.targets.zenodo.functions.keywords:zenodo_fetch_keywords',
+        ('zenodo', 'keywords_upload'): 'presqt.targets.zenodo.functions.keywords:zenodo_upload_keywords',
+
+        ('gitlab', 'resource_collection'): 'presqt.targets.gitlab.functions.fetch:gitlab_fetch_resources',
+        ('gitlab', 'resource_detail'): 'presqt.targets.gitlab.functions.fetch:gitlab_fetch_resource',
+        ('gitlab', 'resource_download'): 'presqt.targets.gitlab.functions.download:gitlab_download_resource',
+        ('gitlab', 'resource_upload'): 'presqt.targets.gitlab.functions.upload:gitlab_upload_resource',
+        ('gitlab', 'metadata_upload'): 'presqt.targets.gitlab.functions.upload_metadata:gitlab_upload_metadata',
+        ('gitlab', 'keywords'): 'presqt.targets.gitlab.functions.keywords:gitlab_fetch_keywords',
+        ('gitlab', 'keywords_upload'): 'presqt.targets.gitlab.functions.keywords:gitlab_upload_keywords',
+
+        ('figshare', 'resource_collection'): 'presqt.targets.figshare.functions.fetch:figshare_fetch_resources',
+        ('figshare', 'resource_detail'): 'presqt.targets.figshare.functions.fetch:figshare_fetch_resource',
+        ('figshare', 'resource_download'): 'presqt.targets.figshare.functions.download:figshare_download_resource',
+        ('figshare', 'resource_upload'): 'presqt.targets.figshare.functions.upload:figshare_upload_resource',
+        ('figshare', 'metadata_upload'): 'presqt.targets.figshare.functions.upload_metadata:figshare_upload_metadata',
+        ('figshare', 'keywords'): 'presqt.targets.figshare.functions.keywords:figshare_fetch_keywords',
+        ('figshare', 'keywords_upload'): 'presqt.targets.figshare.functions.keywords:figshare_upload_keywords',
+    }
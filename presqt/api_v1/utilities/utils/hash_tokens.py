@@ -1,10 +1,16 @@
 import hashlib
 
+from django.conf import settings
+
 
 def hash_tokens(token):
     """
     Hash a user's token to securely store in process_info.
 
+    The hash is a BLAKE2b digest keyed with the Django SECRET_KEY, so ticket numbers can't be
+    derived from a token without the server's secret. Changing the SECRET_KEY changes every
+    ticket number.
+
     Parameters
     ----------
     token : str
@@ -14,7 +20,8 @@ def hash_tokens(token):
     -------
     The hashed token.
     """
-    hashed_token = hashlib.sha256(token.encode())
+    hashed_token = hashlib.blake2b(
+        token.encode(), digest_size=16, key=settings.SECRET_KEY.encode()[:64])
 
     # Returns as a string of double length, containing only hexadecimal digits.
     return hashed_token.hexdigest()
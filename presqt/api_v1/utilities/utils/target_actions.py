@@ -1,12 +1,16 @@
 
+from functools import lru_cache
+
 from django.urls import reverse
 
-from presqt.api_v1.utilities import get_target_data
+from presqt.api_v1.utilities import get_target_data, url_template
 
 
+@lru_cache(maxsize=None)
 def action_checker(target_name):
     """
     Checks in on targets.json and determines what actions are available for the requesting target.
+    targets.json doesn't change while the server is running so the result is cached per target.
 
     Parameters
     ----------
@@ -14,12 +18,12 @@ def action_checker(target_name):
 
     Returns
     -------
-    A list of available actions for the target.
+    A tuple of available actions for the target.
     """
     target_json = get_target_data(target_name)
     supported_actions = target_json['supported_actions']
 
-    return [action for action, boolean in supported_actions.items() if boolean is True]
+    return tuple(action for action, boolean in supported_actions.items() if boolean is True)
 
 
 def link_builder(self, instance, list_of_actions):
@@ -48,11 +52,10 @@ def link_builder(self, instance, list_of_actions):
     if self.context.get('target_name') in ['github', 'gitlab']:
         instance_id = instance_id.replace('%252E', '%2E').replace('%252F', '%2F')
 
+    collection_template = url_template('resource_collection', 'target_name')
     for action in list_of_actions:
         if action == 'resource_collection':
-            reversed_collection = reverse(
-                viewname='resource_collection',
-                kwargs={'target_name': instance['name']})
+            reversed_collection = collection_template.format(instance['name'])
             links.append({"name": "Collection", "link": self.context['request'].build_absolute_uri(
                 reversed_collection), "method": "GET"})
 
@@ -76,9 +79,7 @@ def link_builder(self, instance, list_of_actions):
             try:
                 kind = instance['kind']
             except KeyError:
-                reversed_upload = reverse(
-                    viewname='resource_collection',
-                    kwargs={'target_name': instance['name']})
+                reversed_upload = collection_template.format(instance['name'])
                 links.append({"name": "Upload", "link": self.context['request'].build_absolute_uri(
                     reversed_upload), "method": "POST"})
             else:
@@ -94,9 +95,7 @@ def link_builder(self, instance, list_of_actions):
             try:
                 kind = instance['kind']
             except KeyError:
-                reversed_transfer = reverse(
-                    viewname='resource_collection',
-                    kwargs={'target_name': instance['name']})
+                reversed_transfer = collection_template.format(instance['name'])
                 links.append({"name": "Transfer", "link": self.context['request'].build_absolute_uri(
                     reversed_transfer), "method": "POST"})
             else:
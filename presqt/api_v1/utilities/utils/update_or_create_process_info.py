@@ -22,12 +22,18 @@ def update_or_create_process_info(process_obj, action, ticket_number):
     """
     process_info_path = os.path.join('mediafiles', 'jobs', str(ticket_number), 'process_info.json')
     # If there already exists a process_info.json file for this user then add to the process dict
-    if os.path.isfile(process_info_path):
+    try:
         file_obj = read_file(process_info_path, True)
-        file_obj[action] = process_obj
     # If no process_info.json file exists for this user than create a new process dict
-    else:
+    except FileNotFoundError:
         file_obj = {action: process_obj}
+    else:
+        file_obj[action] = process_obj
+
+    # Write to a temporary file first and swap it into place so anyone reading process_info.json
+    # never sees a partially written file
+    temp_path = '{}.{}.tmp'.format(process_info_path, os.getpid())
+    write_file(temp_path, file_obj, True)
+    os.replace(temp_path, process_info_path)
 
-    write_file(process_info_path, file_obj, True)
     return process_info_path
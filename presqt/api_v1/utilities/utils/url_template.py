@@ -0,0 +1,30 @@
+from functools import lru_cache
+
+from django.urls import reverse
+
+# Stand-in value reversed in place of the variable URL kwarg
+_PLACEHOLDER = '__presqt_url_kwarg__'
+
+
+@lru_cache(maxsize=None)
+def url_template(viewname, kwarg, **fixed_kwargs):
+    """
+    Resolve a URL path once and return it as a template for its variable kwarg.
+    The URL conf may not be ready at import time so the path is resolved on first use and
+    cached after that.
+
+    Parameters
+    ----------
+    viewname : str
+        Name of the URL pattern to reverse
+    kwarg : str
+        Name of the URL kwarg that changes between calls
+    fixed_kwargs : dict
+        Any other URL kwargs, which are the same for every call
+
+    Returns
+    -------
+    The path as a string to call .format() on with the value of the variable kwarg.
+    """
+    path = reverse(viewname, kwargs={kwarg: _PLACEHOLDER, **fixed_kwargs})
+    return path.replace(_PLACEHOLDER, '{}')
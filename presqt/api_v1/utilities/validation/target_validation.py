@@ -2,6 +2,9 @@ from rest_framework import status
 
 from presqt.utilities import PresQTValidationError, read_file
 
+# targets.json is static for the life of the server so it is read once and keyed by target name.
+_TARGETS = {data['name']: data for data in read_file('presqt/specs/targets.json', True)}
+
 
 def target_validation(target_name, action):
     """
@@ -20,18 +23,17 @@ def target_validation(target_name, action):
     True if the validation passes.
     Raises a custom ValidationException error if validation fails.
     """
-    json_data = read_file('presqt/specs/targets.json', True)
-    for data in json_data:
-        if data['name'] == target_name:
-            if data["supported_actions"][action] is False:
-                raise PresQTValidationError(
-                    "PresQT Error: '{}' does not support the action '{}'.".format(target_name, action),
-                    status.HTTP_400_BAD_REQUEST)
-            return True, data['infinite_depth']
-    else:
+    data = _TARGETS.get(target_name)
+    if data is None:
         raise PresQTValidationError(
             "PresQT Error: '{}' is not a valid Target name.".format(target_name), status.HTTP_404_NOT_FOUND)
 
+    if data["supported_actions"][action] is False:
+        raise PresQTValidationError(
+            "PresQT Error: '{}' does not support the action '{}'.".format(target_name, action),
+            status.HTTP_400_BAD_REQUEST)
+    return True, data['infinite_depth']
+
 
 def transfer_target_validation(source_target, destination_target):
     """
@@ -52,21 +54,20 @@ def transfer_target_validation(source_target, destination_target):
     -------
     True if the targets allow transfer with each other.
     """
-    json_data = read_file('presqt/specs/targets.json', True)
-
-    for data in json_data:
-        if data['name'] == source_target:
-            if destination_target not in data['supported_transfer_partners']['transfer_out']:
-                raise PresQTValidationError(
-                    "PresQT Error: '{}' does not allow transfer to '{}'.".format(
-                        source_target, destination_target),
-                    status.HTTP_400_BAD_REQUEST)
+    source_data = _TARGETS.get(source_target)
+    if source_data is not None:
+        if destination_target not in source_data['supported_transfer_partners']['transfer_out']:
+            raise PresQTValidationError(
+                "PresQT Error: '{}' does not allow transfer to '{}'.".format(
+                    source_target, destination_target),
+                status.HTTP_400_BAD_REQUEST)
 
-        elif data['name'] == destination_target:
-            if source_target not in data['supported_transfer_partners']['transfer_in']:
-                raise PresQTValidationError(
-                    "PresQT Error: '{}' does not allow transfer from '{}'.".format(
-                        destination_target, source_target),
-                    status.HTTP_400_BAD_REQUEST)
+    destination_data = _TARGETS.get(destination_target)
+    if destination_data is not None and destination_target != source_target:
+        if source_target not in destination_data['supported_transfer_partners']['transfer_in']:
+            raise PresQTValidationError(
+                "PresQT Error: '{}' does not allow transfer from '{}'.".format(
+                    destination_target, source_target),
+                status.HTTP_400_BAD_REQUEST)
 
     return True
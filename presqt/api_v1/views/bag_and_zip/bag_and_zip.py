@@ -4,7 +4,6 @@ from uuid import uuid4
 
 import bagit
 from django.http import HttpResponse
-from rest_framework import renderers
 from rest_framework.views import APIView
 from rest_framework.response import Response
 
@@ -20,8 +19,6 @@ class BagAndZip(APIView):
         - Take a provided file, make it BagIt format, and zip it up to return back to the user.
     """
 
-    renderer_classes = [renderers.JSONRenderer]
-
     def post(self, request):
         """
         Take a zipped file, format it using BagIt, and return it to the user.
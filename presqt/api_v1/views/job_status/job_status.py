@@ -6,7 +6,7 @@ from dateutil.relativedelta import relativedelta
 from django.utils.datastructures import MultiValueDictKeyError
 from django.http import HttpResponse
 from django.utils import timezone
-from rest_framework import status, renderers
+from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 
@@ -24,8 +24,6 @@ class JobStatus(APIView):
     * Patch: Cancel a job
     """
 
-    renderer_classes = [renderers.JSONRenderer]
-
     def get(self, request, action, response_format=None):
         """
         Retrieve the status of a job.
@@ -3,14 +3,12 @@ import shutil
 import zipfile
 import requests
 import json
+from datetime import timedelta
 from uuid import uuid4
 
 import bagit
-from dateutil.relativedelta import relativedelta
 from django.utils import timezone
-from django.utils.decorators import method_decorator
-from django.views.decorators.csrf import csrf_protect
-from rest_framework import status, renderers
+from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.reverse import reverse
 from rest_framework.views import APIView
@@ -39,12 +37,16 @@ from presqt.json_schemas.schema_handlers import schema_validator
 from presqt.utilities import (PresQTValidationError, PresQTResponseException, write_file,
                               zip_directory, read_file, update_process_info_message, increment_process_info)
 
+# How long a job's process_info entry is kept before it expires
+JOB_EXPIRATION_DELTA = timedelta(hours=5)
+# How long a job's process_info entry is kept once the job has finished
+FINISHED_JOB_EXPIRATION_DELTA = timedelta(hours=1)
+
 
 class BaseResource(APIView):
     """
     Base View for Resource views. Handles shared POSTs (upload and transfer) and download methods.
     """
-    renderer_classes = [renderers.JSONRenderer]
 
     def post(self, request, target_name, resource_id=None):
         """
@@ -210,26 +212,30 @@ class BaseResource(APIView):
         except PresQTValidationError as e:
             return Response(data={'error': e.data}, status=e.status_code)
 
-        self.ticket_number = hash_tokens(self.destination_token)
-        ticket_path = os.path.join('mediafiles', 'jobs', str(self.ticket_number))
+        self.ticket_number = hashed_destination_token = hash_tokens(self.destination_token)
+        ticket_path = f'mediafiles/jobs/{self.ticket_number}'
         # Check if this user currently has any other process in progress
         user_has_process_running = multiple_process_check(ticket_path)
         if user_has_process_running:
             return Response(data={'error': 'User currently has processes in progress.'},
                             status=status.HTTP_400_BAD_REQUEST)
 
-        self.ticket_path = os.path.join('mediafiles', 'jobs', str(self.ticket_number), 'upload')
+        self.ticket_path = f'{ticket_path}/upload'
 
         # Remove any resources that already exist in this user's job directory
-        if os.path.exists(self.ticket_path):
-            for folder in next(os.walk(self.ticket_path))[1]:
-                shutil.rmtree(os.path.join(self.ticket_path, folder))
+        try:
+            with os.scandir(self.ticket_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+        except FileNotFoundError:
+            pass
 
         # Write process_info.json file
         self.process_info_obj = {
-            'presqt-destination-token': hash_tokens(self.destination_token),
+            'presqt-destination-token': hashed_destination_token,
             'status': 'in_progress',
-            'expiration': str(timezone.now() + relativedelta(hours=5)),
+            'expiration': str(timezone.now() + JOB_EXPIRATION_DELTA),
             'message': 'Saving files to server and validating bag...',
             'status_code': None,
             'function_process_id': None,
@@ -337,7 +343,7 @@ class BaseResource(APIView):
             self.process_info_obj['message'] = e.data
             # Update the expiration from 5 hours to 1 hour from now. We can delete this faster because
             # it's an incomplete/failed directory.
-            self.process_info_obj['expiration'] = str(timezone.now() + relativedelta(hours=1))
+            self.process_info_obj['expiration'] = str(timezone.now() + FINISHED_JOB_EXPIRATION_DELTA)
             update_or_create_process_info(self.process_info_obj, self.action, self.ticket_number)
 
             return False
@@ -563,7 +569,7 @@ class BaseResource(APIView):
                 self.process_info_obj['message'] = e.data
                 # Update the expiration from 5 hours to 1 hour from now. We can delete this faster because
                 # it's an incomplete/failed directory.
-                self.process_info_obj['expiration'] = str(timezone.now() + relativedelta(hours=1))
+                self.process_info_obj['expiration'] = str(timezone.now() + FINISHED_JOB_EXPIRATION_DELTA)
                 update_or_create_process_info(
                     self.process_info_obj, self.action, self.ticket_number)
                 return False
@@ -594,7 +600,7 @@ class BaseResource(APIView):
             self.process_info_obj['message'] = e.data
             # Update the expiration from 5 hours to 1 hour from now. We can delete this faster
             # because it's an incomplete/failed directory.
-            self.process_info_obj['expiration'] = str(timezone.now() + relativedelta(hours=1))
+            self.process_info_obj['expiration'] = str(timezone.now() + FINISHED_JOB_EXPIRATION_DELTA)
             update_or_create_process_info(self.process_info_obj, self.action, self.ticket_number)
             return False
 
@@ -701,9 +707,10 @@ class BaseResource(APIView):
             return Response(data={'error': e.data}, status=e.status_code)
 
         # Generate ticket number
-        self.ticket_number = '{}_{}'.format(hash_tokens(
-            self.source_token), hash_tokens(self.destination_token))
-        ticket_path = os.path.join("mediafiles", "jobs", str(self.ticket_number))
+        hashed_source_token = hash_tokens(self.source_token)
+        hashed_destination_token = hash_tokens(self.destination_token)
+        self.ticket_number = '{}_{}'.format(hashed_source_token, hashed_destination_token)
+        ticket_path = f'mediafiles/jobs/{self.ticket_number}'
 
         # Check if this user currently has any other process in progress
         user_has_process_running = multiple_process_check(ticket_path)
@@ -711,14 +718,14 @@ class BaseResource(APIView):
             return Response(data={'error': 'User currently has processes in progress.'},
                             status=status.HTTP_400_BAD_REQUEST)
 
-        self.ticket_path = os.path.join('mediafiles', 'jobs', str(self.ticket_number), 'transfer')
+        self.ticket_path = f'{ticket_path}/transfer'
 
         # Create directory and process_info json file
         self.process_info_obj = {
-            'presqt-source-token': hash_tokens(self.source_token),
-            'presqt-destination-token': hash_tokens(self.destination_token),
+            'presqt-source-token': hashed_source_token,
+            'presqt-destination-token': hashed_destination_token,
             'status': 'in_progress',
-            'expiration': str(timezone.now() + relativedelta(hours=5)),
+            'expiration': str(timezone.now() + JOB_EXPIRATION_DELTA),
             'message': 'Transfer is being processed on the server',
             'download_status': None,
             'upload_status': None,
@@ -732,14 +739,17 @@ class BaseResource(APIView):
         self.process_info_path = update_or_create_process_info(
             self.process_info_obj, self.action, self.ticket_number)
 
-        self.base_directory_name = '{}_{}_transfer_{}'.format(self.source_target_name,
-                                                              self.destination_target_name,
-                                                              self.source_resource_id)
+        self.base_directory_name = (f'{self.source_target_name}_{self.destination_target_name}'
+                                    f'_transfer_{self.source_resource_id}')
 
         # Remove any resources that already exist in this user's job directory
-        if os.path.exists(self.ticket_path):
-            for folder in next(os.walk(self.ticket_path))[1]:
-                shutil.rmtree(os.path.join(self.ticket_path, folder))
+        try:
+            with os.scandir(self.ticket_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+        except FileNotFoundError:
+            pass
 
         # Spawn the transfer_resource method separate from the request server by using multiprocess.
         spawn_action_process(self, self._transfer_resource, self.action)
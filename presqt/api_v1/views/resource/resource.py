@@ -1,19 +1,17 @@
 import os
 import shutil
-from uuid import uuid4
 
-from dateutil.relativedelta import relativedelta
 from django.utils import timezone
-from rest_framework import status, renderers
+from rest_framework import status
 from rest_framework.response import Response
-from rest_framework.reverse import reverse
 
 from presqt.api_v1.serializers.resource import ResourceSerializer
 from presqt.api_v1.utilities import (get_source_token, target_validation, FunctionRouter,
                                      spawn_action_process, hash_tokens,
-                                     update_or_create_process_info, get_user_email_opt)
+                                     update_or_create_process_info, get_user_email_opt,
+                                     url_template)
 from presqt.api_v1.utilities.utils.multiple_process_check import multiple_process_check
-from presqt.api_v1.views.resource.base_resource import BaseResource
+from presqt.api_v1.views.resource.base_resource import BaseResource, JOB_EXPIRATION_DELTA
 from presqt.utilities import PresQTValidationError, PresQTResponseException
 
 
@@ -31,8 +29,6 @@ class Resource(BaseResource):
         - Transfer resources from one Target to another.
     """
 
-    renderer_classes = [renderers.JSONRenderer]
-
     def get(self, request, target_name, resource_id, resource_format=None):
         """
         Retrieve details about a specific Resource.
@@ -157,7 +153,7 @@ class Resource(BaseResource):
         else:
             return Response(
                 data={
-                    'error': 'PresQT Error: {} is not a valid format for this endpoint.'.format(resource_format)},
+                    'error': f'PresQT Error: {resource_format} is not a valid format for this endpoint.'},
                 status=status.HTTP_400_BAD_REQUEST)
 
     def get_json_format(self):
@@ -208,8 +204,8 @@ class Resource(BaseResource):
             return Response(data={'error': e.data}, status=e.status_code)
 
         # Generate ticket number
-        self.ticket_number = hash_tokens(self.source_token)
-        ticket_path = os.path.join('mediafiles', 'jobs', str(self.ticket_number))
+        self.ticket_number = hashed_source_token = hash_tokens(self.source_token)
+        ticket_path = f'mediafiles/jobs/{self.ticket_number}'
 
         # Check if this user currently has any other process in progress
         user_has_process_running = multiple_process_check(ticket_path)
@@ -217,13 +213,13 @@ class Resource(BaseResource):
             return Response(data={'error': 'User currently has processes in progress.'},
                             status=status.HTTP_400_BAD_REQUEST)
 
-        self.ticket_path = os.path.join('mediafiles', 'jobs', str(self.ticket_number), 'download')
+        self.ticket_path = f'{ticket_path}/download'
 
         # Create directory and process_info json file
         self.process_info_obj = {
-            'presqt-source-token': hash_tokens(self.source_token),
+            'presqt-source-token': hashed_source_token,
             'status': 'in_progress',
-            'expiration': str(timezone.now() + relativedelta(hours=5)),
+            'expiration': str(timezone.now() + JOB_EXPIRATION_DELTA),
             'message': 'Download is being processed on the server',
             'status_code': None,
             'function_process_id': None,
@@ -233,26 +229,29 @@ class Resource(BaseResource):
         self.process_info_path = update_or_create_process_info(
             self.process_info_obj, self.action, self.ticket_number)
 
-        self.base_directory_name = '{}_download_{}'.format(self.source_target_name,
-                                                           self.source_resource_id)
+        self.base_directory_name = f'{self.source_target_name}_download_{self.source_resource_id}'
 
         # Remove any resources that already exist in this user's job download directory
-        if os.path.exists(self.ticket_path):
-            for folder in next(os.walk(self.ticket_path))[1]:
-                shutil.rmtree(os.path.join(self.ticket_path, folder))
+        try:
+            with os.scandir(self.ticket_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+        except FileNotFoundError:
+            pass
 
         # Spawn the upload_resource method separate from the request server by using multiprocess.
         spawn_action_process(self, self._download_resource, 'resource_download')
 
+        job_status_template = url_template('job_status', 'response_format', action='download')
+
         # Get the download url for zip format
-        reversed_url = reverse('job_status', kwargs={
-                               'action': 'download', 'response_format': 'zip'})
-        download_zip_hyperlink = self.request.build_absolute_uri(reversed_url)
+        download_zip_hyperlink = self.request.build_absolute_uri(
+            job_status_template.format('zip'))
 
         # Get the download url for json format
-        reversed_url = reverse('job_status', kwargs={
-                               'action': 'download', 'response_format': 'json'})
-        download_json_hyperlink = self.request.build_absolute_uri(reversed_url)
+        download_json_hyperlink = self.request.build_absolute_uri(
+            job_status_template.format('json'))
 
         return Response(status=status.HTTP_202_ACCEPTED,
                         data={'message': 'The server is processing the request.',
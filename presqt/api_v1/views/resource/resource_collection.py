@@ -1,4 +1,3 @@
-from rest_framework import renderers
 from rest_framework.response import Response
 
 from presqt.api_v1.serializers.resource import ResourcesSerializer
@@ -18,8 +17,6 @@ class ResourceCollection(BaseResource):
         -  Upload a top level resource for a user.
     """
 
-    renderer_classes = [renderers.JSONRenderer]
-
     def get(self, request, target_name):
         """
         Retrieve all Resources.
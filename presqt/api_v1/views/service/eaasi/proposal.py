@@ -6,7 +6,7 @@ import requests
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.reverse import reverse
-from rest_framework import status, renderers
+from rest_framework import status
 
 from presqt.api_v1.utilities import (get_process_info_data, get_source_token, hash_tokens,
                                      get_process_info_action)
@@ -21,8 +21,6 @@ class Proposals(APIView):
         - Send an EaaSI download URL to the EaaSI API to start a proposal task.
     """
 
-    renderer_classes = [renderers.JSONRenderer]
-
     def post(self, request):
         """
         Upload a proposal task to EaaSI
@@ -107,8 +105,6 @@ class Proposal(APIView):
         - Poll a proposal task
     """
 
-    renderer_classes = [renderers.JSONRenderer]
-
     def get(self, request, proposal_id):
         """
         200: OK
@@ -2,7 +2,7 @@ import coreapi
 import json
 import requests
 
-from rest_framework import status, renderers
+from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
@@ -16,8 +16,6 @@ class FairshakeAssessment(APIView):
     """
     """
 
-    renderer_classes = [renderers.JSONRenderer]
-
     def get(self, request, rubric_id):
         """
         Get details of the provided rubric.
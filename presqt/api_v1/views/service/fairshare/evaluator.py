@@ -1,7 +1,7 @@
 import json
 
 import requests
-from rest_framework import status, renderers
+from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
@@ -15,8 +15,6 @@ class FairshareEvaluator(APIView):
     """
     """
 
-    renderer_classes = [renderers.JSONRenderer]
-
     def get(self, request):
         """
         Returns the list of tests available to the user.
@@ -1,6 +1,6 @@
 import json
 
-from rest_framework import status, renderers
+from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
@@ -16,7 +16,6 @@ class ServiceCollection(APIView):
     """
 
     required_scopes = ['read']
-    renderer_classes = [renderers.JSONRenderer]
 
     def get(self, request):
         """
@@ -56,7 +55,6 @@ class Service(APIView):
     """
 
     required_scopes = ['read']
-    renderer_classes = [renderers.JSONRenderer]
 
     def get(self, request, service_name):
         """
@@ -1,5 +1,4 @@
 import requests
-from rest_framework import renderers
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
@@ -14,7 +13,6 @@ class StatusCollection(APIView):
     """
 
     required_scopes = ["read"]
-    renderer_classes = [renderers.JSONRenderer]
 
     def get(self, request):
         """
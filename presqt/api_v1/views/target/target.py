@@ -1,10 +1,10 @@
 import json
 
-from rest_framework import status, renderers
+from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from presqt.api_v1.serializers.target import TargetsSerializer, TargetSerializer
+from presqt.api_v1.serializers.target import serialize_target_list, TargetSerializer
 from presqt.utilities import read_file
 
 
@@ -15,7 +15,6 @@ class TargetCollection(APIView):
     * Get: Retrieve summary representations of all Targets.
     """
     required_scopes = ['read']
-    renderer_classes = [renderers.JSONRenderer]
 
     def get(self, request):
         """
@@ -90,11 +89,9 @@ class TargetCollection(APIView):
         ]
         """
         with open('presqt/specs/targets.json') as json_file:
-            serializer = TargetsSerializer(instance=json.load(json_file),
-                                           many=True,
-                                           context={'request': request})
+            targets = serialize_target_list(json.load(json_file), request)
 
-        return Response(serializer.data)
+        return Response(targets)
 
 class Target(APIView):
     """
@@ -103,7 +100,6 @@ class Target(APIView):
     * Get: Retrieve summary representations of a specific Targets.
     """
     required_scopes = ['read']
-    renderer_classes = [renderers.JSONRenderer]
 
     def get(self, request, target_name):
         """
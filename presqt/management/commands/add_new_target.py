@@ -202,23 +202,20 @@ class Command(BaseCommand):
                 print('File created: {}upload.py'.format(target_function_dir))
 
         ##### Write to function_router.py #####
-        with open('presqt/api_v1/utilities/utils/function_router.py', 'a') as file:
-            if target_functions:
-                file.write('\n')
-
-            for file_name, file_name_dict in target_functions.items():
-                for variable_name, function_name in file_name_dict.items():
-                    file.write('    {} = {}\n'.format(variable_name, function_name))
-
         with open('presqt/api_v1/utilities/utils/function_router.py', 'r+') as file:
             content = file.read()
             file.seek(0, 0)
 
-            new_imports = ''
+            new_routes = '\n' if target_functions else ''
             for file_name, file_name_dict in target_functions.items():
-                new_imports += 'from presqt.targets.{}.functions.{} import {}\n'.format(target_name, file_name, ', '.join(file_name_dict.values()))
+                for variable_name, function_name in file_name_dict.items():
+                    action = variable_name[len(target_name) + 1:]
+                    new_routes += "        ('{}', '{}'): 'presqt.targets.{}.functions.{}:{}',\n".format(
+                        target_name, action, target_name, file_name, function_name)
 
-            file.write(new_imports + content)
+            # Add the new routes to the end of the FunctionRouter._ROUTES dictionary
+            routes_end = content.rindex('    }\n')
+            file.write(content[:routes_end] + new_routes + content[routes_end:])
         print('File updated: presqt/api_v1/utilities/utils/function_router.py')
 
         ##### Write to targets.json #####
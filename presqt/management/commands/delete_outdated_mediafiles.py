@@ -32,8 +32,8 @@ class Command(BaseCommand):
                 shutil.rmtree(directory)
                 print('{} has been deleted. No process_info.json file found'.format(directory))
             else:
-                for key, value in data.items():
-                    if 'expiration' in value.keys():
+                for value in data.values():
+                    if 'expiration' in value:
                         if parse(value['expiration']) <= timezone.now() or os.environ['ENVIRONMENT'] == 'development':
                             shutil.rmtree(directory)
                             print('{} has been deleted.'.format(directory))
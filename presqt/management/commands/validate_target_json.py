@@ -44,8 +44,8 @@ class Command(BaseCommand):
                 for key, value in data['supported_actions'].items():
                     if key in keys_to_validate and value is True:
                         try:
-                            getattr(FunctionRouter, f"{data['name']}_{key}")
-                        except AttributeError:
+                            FunctionRouter.get_function(data['name'], key)
+                        except (KeyError, ImportError, AttributeError):
                             print(f"{data['name']} does not have a corresponding function in FunctionRouter for "
                                   f"the attribute {key}")
                             exit(2)
@@ -1,5 +1,3 @@
-import glob
-import json
 import os
 
 from dateutil.relativedelta import relativedelta
@@ -9,22 +7,22 @@ from django.core.management import call_command
 from django.test import SimpleTestCase
 from django.utils import timezone
 
-from presqt.utilities import read_file, write_file
+from presqt.utilities import write_file
 
 
 class TestDeleteMediaFiles(SimpleTestCase):
     def setUp(self):
         self.env = patch.dict('os.environ', {'ENVIRONMENT': 'production'})
         self.directory = 'mediafiles/jobs/test_command/'
-        if not os.path.exists(self.directory):
-            os.makedirs(self.directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.process_info_path = os.path.join(self.directory, 'process_info.json')
+        self.now = timezone.now()
         self.data = (
             {'resource_upload': {"presqt-source-token": "blahblah", "status": "in_progress",
-                                 "expiration": str(timezone.now()+relativedelta(days=5)),
+                                 "expiration": str(self.now + relativedelta(days=5)),
                                  "message": "Download successful", "status_code": "200",
                                  "zip_name": "test.zip"}})
-        with open('{}process_info.json'.format(self.directory), 'w+') as file:
-            json.dump(self.data, file)
+        write_file(self.process_info_path, self.data, True)
 
     def test_files_to_be_retained(self):
         """
@@ -32,24 +30,20 @@ class TestDeleteMediaFiles(SimpleTestCase):
         current date, the data that has been downloaded in this folder will be retained.
         """
         with self.env:
-            data_pre_command = glob.glob('mediafiles/jobs/test_command/process_info.json')
-            self.assertEqual(len(data_pre_command), 1)
+            self.assertTrue(os.path.isfile(self.process_info_path))
 
             call_command('delete_outdated_mediafiles')
 
             # Ensure that the folder and files have been retained
-            data_post_command = glob.glob('mediafiles/jobs/test_command/')
-            self.assertEqual(len(data_post_command), 1)
+            self.assertTrue(os.path.isdir(self.directory))
 
         # Test in development mode.....all mediafiles should be deleted.
-        data_pre_command = glob.glob('mediafiles/jobs/test_command/process_info.json')
-        self.assertEqual(len(data_pre_command), 1)
+        self.assertTrue(os.path.isfile(self.process_info_path))
 
         call_command('delete_outdated_mediafiles')
 
         # Ensure that the folder and files have been deleted
-        data_post_command = glob.glob('mediafiles/jobs/test_command/')
-        self.assertEqual(len(data_post_command), 0)
+        self.assertFalse(os.path.isdir(self.directory))
 
     def test_files_to_delete(self):
         """
@@ -57,32 +51,25 @@ class TestDeleteMediaFiles(SimpleTestCase):
         current date, that data that has been downloaded will be deleted.
         """
         with self.env:
-            # These steps are required to alter the timestamp inside our process_info.json
-            data = read_file('{}process_info.json'.format(self.directory), True)
-
-            # Set the expiration date to be yesterday
-            data['resource_upload']['expiration'] = str(timezone.now() - relativedelta(days=1))
-
-            # Write the data JSON back to the process_info file
-            write_file('{}process_info.json'.format(self.directory), data, True)
+            # Set the expiration date to be yesterday and overwrite the process_info.json file
+            expired_upload = {**self.data['resource_upload'],
+                              'expiration': str(self.now - relativedelta(days=1))}
+            write_file(self.process_info_path,
+                       {**self.data, 'resource_upload': expired_upload}, True)
 
-            data_pre_command = glob.glob('mediafiles/jobs/test_command/process_info.json')
-            self.assertEqual(len(data_pre_command), 1)
+            self.assertTrue(os.path.isfile(self.process_info_path))
 
             call_command('delete_outdated_mediafiles')
 
             # Check that the folder has been deleted
-            data_post_command = glob.glob('mediafiles/jobs/test_command/')
-            self.assertEqual(len(data_post_command), 0)
+            self.assertFalse(os.path.isdir(self.directory))
 
             # Test that a directory without a process_info.json file gets deleted
             os.makedirs(self.directory)
 
-            data_pre_command = glob.glob('mediafiles/jobs/test_command/')
-            self.assertEqual(len(data_pre_command), 1)
+            self.assertTrue(os.path.isdir(self.directory))
 
             call_command('delete_outdated_mediafiles')
 
             # Check that the folder has been deleted
-            data_post_command = glob.glob('mediafiles/jobs/test_command/')
-            self.assertEqual(len(data_post_command), 0)
+            self.assertFalse(os.path.isdir(self.directory))
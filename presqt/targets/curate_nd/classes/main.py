@@ -41,7 +41,22 @@ class CurateND(CurateNDBase):
         else:
             raise PresQTInvalidTokenError("Token is invalid. Response returned a 500 error.")
 
-    def items(self, url):
+    def get_page_json(self, url):
+        """
+        Get the JSON for one page of results.
+
+        Parameters
+        ----------
+        url : str
+            The url of the page to get.
+
+        Returns
+        -------
+        The page's JSON, including its results and pagination info.
+        """
+        return self._json(self.get(url))
+
+    def items(self, url, response_json=None):
         """
         Get all items.
 
@@ -49,12 +64,17 @@ class CurateND(CurateNDBase):
         ----------
         url : str
             The url used to retrive all items.
+        response_json : dict
+            The already fetched JSON for the url, if the caller has it.
 
         Returns
         -------
         List of the desired Items.
         """
-        response_data = self._get_all_paginated_data(url)
+        if response_json is None:
+            response_data = self._get_all_paginated_data(url)
+        else:
+            response_data = response_json['results']
         item_urls = []
         for response in response_data:
             if response['type'] == 'Person':
@@ -107,7 +127,7 @@ class CurateND(CurateNDBase):
         else:
             return Item(response_data.json(), self.session)
 
-    def get_resources(self, url=None):
+    def get_resources(self, url=None, response_json=None):
         """
         Get all of the requested resources. Return in the structure expected for the PresQT API.
 
@@ -117,13 +137,15 @@ class CurateND(CurateNDBase):
             Path to the process info file that keeps track of the action's progress
         url : str
             The url used to retrive all items.
+        response_json : dict
+            The already fetched JSON for the url, if the caller has it.
 
         Returns
         -------
         List of all items.
         """
         resources = []
-        items = self.items(url)
+        items = self.items(url, response_json)
 
         for item in items:
             # Items
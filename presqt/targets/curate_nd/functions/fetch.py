@@ -63,9 +63,10 @@ def curate_nd_fetch_resources(token, query_parameter):
             if 'page' in query_parameter:
                 search_url = 'https://curate.nd.edu/api/items?q={}&search_fields=title&page={}'.format(
                     query_parameters, query_parameter['page'])
-            pages = get_page_numbers(search_url, token)
+            response_json = curate_instance.get_page_json(search_url)
+            pages = get_page_numbers(search_url, token, response_json)
             try:
-                resources = curate_instance.get_resources(search_url)
+                resources = curate_instance.get_resources(search_url, response_json)
             except PresQTValidationError as e:
                 raise e
 
@@ -74,9 +75,10 @@ def curate_nd_fetch_resources(token, query_parameter):
             if 'page' in query_parameter:
                 search_url = 'https://curate.nd.edu/api/items?q={}&page={}'.format(
                     query_parameter['general'], query_parameter['page'])
-            pages = get_page_numbers(search_url, token)
+            response_json = curate_instance.get_page_json(search_url)
+            pages = get_page_numbers(search_url, token, response_json)
             try:
-                resources = curate_instance.get_resources(search_url)
+                resources = curate_instance.get_resources(search_url, response_json)
             except PresQTValidationError as e:
                 raise e
 
@@ -86,12 +88,14 @@ def curate_nd_fetch_resources(token, query_parameter):
         elif 'page' in query_parameter:
             url = 'https://curate.nd.edu/api/items?editor=self&page={}'.format(
                 query_parameter['page'])
-            resources = curate_instance.get_resources(url)
-            pages = get_page_numbers(url, token)
+            response_json = curate_instance.get_page_json(url)
+            resources = curate_instance.get_resources(url, response_json)
+            pages = get_page_numbers(url, token, response_json)
     else:
         url = 'https://curate.nd.edu/api/items?editor=self&page=1'
-        resources = curate_instance.get_resources(url)
-        pages = get_page_numbers(url, token)
+        response_json = curate_instance.get_page_json(url)
+        resources = curate_instance.get_resources(url, response_json)
+        pages = get_page_numbers(url, token, response_json)
 
     return resources, pages
 
@@ -1,7 +1,9 @@
-import requests
+from urllib.parse import parse_qs, urlparse
 
+from presqt.targets.utilities.utils.session import get_shared_session
 
-def get_page_numbers(url, token):
+
+def get_page_numbers(url, token, response_json=None):
     """
     Get the pagination information for the request.
 
@@ -11,18 +13,20 @@ def get_page_numbers(url, token):
         The CurateND url
     token : str
         The CurateND token
+    response_json : dict
+        The already fetched JSON for the url, if the caller has it
 
     Returns
     -------
     A dictionary of page numbers
     """
-    headers = {"X-Api-Token": token}
-
-    pagination_info = requests.get(url, headers=headers).json()['pagination']
+    if response_json is None:
+        response_json = get_shared_session().get(url, headers={"X-Api-Token": token}).json()
+    pagination_info = response_json['pagination']
 
     next_page = None
     previous_page = None
-    total_pages = pagination_info['lastPage'].partition('page=')[2].partition('&')[0]
+    total_pages = _page_from_link(pagination_info['lastPage'])
 
     # If there is only 1 page of results, instead of a number Curate returns 'self'
     if total_pages == 'self':
@@ -30,11 +34,13 @@ def get_page_numbers(url, token):
     if total_pages == '':
         total_pages = '1'
 
-    # We are using partitions to pull the page numbers out of the links that Curate is returning
-    if 'previousPage' in pagination_info.keys():
-        previous_page = pagination_info['previousPage'].partition('page=')[2].partition('&')[0]
-    if 'nextPage' in pagination_info.keys():
-        next_page = pagination_info['nextPage'].partition('page=')[2].partition('&')[0]
+    # Pull the page numbers out of the links that Curate is returning
+    previous_link = pagination_info.get('previousPage')
+    if previous_link is not None:
+        previous_page = _page_from_link(previous_link)
+    next_link = pagination_info.get('nextPage')
+    if next_link is not None:
+        next_page = _page_from_link(next_link)
 
     pages = {
         "first_page": '1',
@@ -46,3 +52,19 @@ def get_page_numbers(url, token):
     }
 
     return pages
+
+
+def _page_from_link(link):
+    """
+    Get the value of the 'page' query parameter in a CurateND pagination link.
+
+    Parameters
+    ----------
+    link : str
+        The pagination link
+
+    Returns
+    -------
+    The page value as a string, or an empty string if the link has no page.
+    """
+    return parse_qs(urlparse(link).query).get('page', [''])[0]
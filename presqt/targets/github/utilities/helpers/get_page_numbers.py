@@ -1,4 +1,4 @@
-import requests
+from presqt.targets.utilities.utils.session import get_shared_session
 
 
 def get_page_numbers(url, headers, page_number):
@@ -19,7 +19,7 @@ def get_page_numbers(url, headers, page_number):
     A dictionary of page numbers
     """
     try:
-        pagination_info = requests.get(url, headers=headers).headers['Link']
+        pagination_info = get_shared_session().get(url, headers=headers).headers['Link']
     except KeyError:
         return {
             "first_page": '1',
@@ -1,4 +1,3 @@
-import math
 import requests
 
 
@@ -21,6 +20,6 @@ def get_page_total(token):
     public_repos = user_data['public_repos']
     private_repos = user_data['total_private_repos']
     total_repos = public_repos + private_repos
-    page_total = math.ceil(total_repos/29)
+    page_total = -(-total_repos // 29)
 
     return page_total
@@ -1,6 +1,6 @@
 
 
-def get_github_repository_data(initial_data, header, resources=[]):
+def get_github_repository_data(initial_data, header, resources=None):
     """
     Get's the repository data.
 
@@ -18,12 +18,14 @@ def get_github_repository_data(initial_data, header, resources=[]):
     -------
     The user's resources.
     """
-    for repo in initial_data:
-        resources.append({
-            "kind": "container",
-            "kind_name": "repo",
-            "container": None,
-            "id": repo["id"],
-            "title": repo["name"]})
+    if resources is None:
+        resources = []
+
+    resources += [{
+        "kind": "container",
+        "kind_name": "repo",
+        "container": None,
+        "id": repo["id"],
+        "title": repo["name"]} for repo in initial_data]
 
     return resources
@@ -7,7 +7,7 @@ from rest_framework import status
 
 from presqt.targets.gitlab.utilities import (
     validation_check, gitlab_paginated_data, download_content, extra_metadata_helper)
-from presqt.utilities import (PresQTResponseException, get_dictionary_from_list,
+from presqt.utilities import (PresQTResponseException,
                               update_process_info,
                               increment_process_info,
                               update_process_info_message)
@@ -193,13 +193,13 @@ def gitlab_download_resource(token, resource_id, process_info_path, action):
     download_data = loop.run_until_complete(
         async_main(file_urls, header, process_info_path, action))
 
+    downloads_by_url = {data['url']: data for data in download_data}
     # Go through the file dictionaries and replace the file path with the binary_content
     # and replace the hashes with the correct file hashes
     for file in files:
-        file['hashes'] = get_dictionary_from_list(
-            download_data, 'url', file['file'])['hashes']
-        file['file'] = get_dictionary_from_list(
-            download_data, 'url', file['file'])['binary_content']
+        file_download = downloads_by_url[file['file']]
+        file['hashes'] = file_download['hashes']
+        file['file'] = file_download['binary_content']
 
     return {
         'resources': files,
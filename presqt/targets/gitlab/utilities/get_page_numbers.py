@@ -1,4 +1,4 @@
-import requests
+from presqt.targets.utilities.utils.session import get_shared_session
 
 
 def get_page_numbers(url, headers):
@@ -16,7 +16,7 @@ def get_page_numbers(url, headers):
     -------
     A dictionary of page numbers
     """
-    page_info = requests.get(url, headers=headers).headers
+    page_info = get_shared_session().get(url, headers=headers).headers
 
     if not page_info['X-Prev-Page']:
         page_info['X-Prev-Page'] = None
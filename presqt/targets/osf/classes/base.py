@@ -1,4 +1,5 @@
 import asyncio
+from itertools import chain
 
 import aiohttp
 from rest_framework import status
@@ -13,6 +14,8 @@ class OSFBase(object):
     """
     Base class for all OSF classes and the main OSF object.
     """
+    __slots__ = ('session',)
+
     def __init__(self, json, session=None):
         # Set the session attribute with the existing session or a new one if one doesn't exist.
         if session is None:
@@ -54,7 +57,7 @@ class OSFBase(object):
 
         # Call all pagination pages asynchronously
         children_data = run_urls_async(self, url_list)
-        [data.extend(child['data']) for child in children_data]
+        data.extend(chain.from_iterable(child['data'] for child in children_data))
 
         return data
 
@@ -79,8 +82,8 @@ class OSFBase(object):
                 next_url = data['links']['next']
                 if next_url:
                     page_total = get_page_total(meta['total'], meta['per_page'])
-                    [url_list.append('{}{}'.format(
-                        next_url[:-1], number)) for number in range(2, page_total + 1)]
+                    url_list.extend('{}{}'.format(
+                        next_url[:-1], number) for number in range(2, page_total + 1))
         return url_list
 
     def get(self, url, *args, **kwargs):
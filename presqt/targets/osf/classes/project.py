@@ -1,14 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from rest_framework import status
 
 from presqt.targets.osf.classes.base import OSFBase
 from presqt.targets.osf.classes.storage_folder import Storage
 from presqt.targets.osf.utilities import OSFNotFoundError
 
+# Each storage walk makes its first-page GETs through the project's PresQTSession, whose
+# connection pool keeps 10 connections per host by default, and then opens its own event loop
+# for the remaining pages. Capping the walks keeps them within that pool and limits how many
+# concurrent requests one download sends to OSF.
+_MAX_WALK_WORKERS = 8
+
+# Attributes copied as-is from the OSF node JSON onto each Project
+_PROJECT_ATTRIBUTES = (
+    'category', 'fork', 'current_user_is_contributor', 'preprint', 'description',
+    'current_user_permissions', 'title', 'custom_citation', 'date_modified', 'collection',
+    'public', 'subjects', 'registration', 'date_created', 'current_user_can_comment',
+    'node_license', 'wiki_enabled', 'tags')
+
 
 class Project(OSFBase):
     """
     Class that represents a project in the OSF API.
     """
+    # Many projects are built while collecting a user's resources so skip the per-instance dict
+    __slots__ = ('id', '_endpoint', '_storages_url', 'kind', 'kind_name', 'size', 'sha256', 'md5',
+                 'parent_node_id', 'children_link', '_storages_cache') + _PROJECT_ATTRIBUTES
+
     def __init__(self, project, session):
         super(Project, self).__init__(project, session)
 
@@ -21,24 +40,8 @@ class Project(OSFBase):
         attrs = project['attributes']
         self.kind = 'container'
         self.kind_name = 'project'
-        self.category = attrs['category']
-        self.fork = attrs['fork']
-        self.current_user_is_contributor = attrs['current_user_is_contributor']
-        self.preprint = attrs['preprint']
-        self.description = attrs['description']
-        self.current_user_permissions = attrs['current_user_permissions']
-        self.title = attrs['title']
-        self.custom_citation = attrs['custom_citation']
-        self.date_modified = attrs['date_modified']
-        self.collection = attrs['collection']
-        self.public = attrs['public']
-        self.subjects = attrs['subjects']
-        self.registration = attrs['registration']
-        self.date_created = attrs['date_created']
-        self.current_user_can_comment = attrs['current_user_can_comment']
-        self.node_license = attrs['node_license']
-        self.wiki_enabled = attrs['wiki_enabled']
-        self.tags = attrs['tags']
+        for attribute in _PROJECT_ATTRIBUTES:
+            setattr(self, attribute, attrs[attribute])
         self.size = None
         self.sha256 = None
         self.md5 = None
@@ -47,14 +50,30 @@ class Project(OSFBase):
         except KeyError:
             self.parent_node_id = None
         self.children_link = project['relationships']['children']['links']['related']['href']
+        # Storages are fetched on first use and then kept for the life of the instance
+        self._storages_cache = None
+
+    def _storages_by_provider(self):
+        """
+        Get this project's storages keyed by their provider name.
+
+        Returns
+        -------
+        Dictionary of Storage objects keyed by provider.
+        """
+        if self._storages_cache is None:
+            stores_json = self._get_all_paginated_data(self._storages_url)
+            self._storages_cache = {}
+            for store in stores_json:
+                storage = Storage(store, self.session)
+                self._storages_cache[storage.provider] = storage
+        return self._storages_cache
 
     def storages(self):
         """
         Iterate over all storages for this project.
         """
-        stores_json = self._get_all_paginated_data(self._storages_url)
-        for store in stores_json:
-            yield Storage(store, self.session)
+        yield from self._storages_by_provider().values()
 
     def storage(self, storage):
         """
@@ -67,21 +86,79 @@ class Project(OSFBase):
 
         Returns
         -------
-        Project object.
+        Storage object.
         """
-        for store in self.storages():
-            if store.provider == storage:
-                return store
-        else:
+        if self._storages_cache is None:
+            # Ask OSF for only the requested provider instead of listing every storage
+            response = self.get(self._storages_url, params={'filter[provider]': storage})
+            if response is not None:
+                for store in self._json(response)['data']:
+                    if store['attributes']['provider'] == storage:
+                        return Storage(store, self.session)
+
+        # The filtered page didn't have the provider, so check every page of storages
+        try:
+            return self._storages_by_provider()[storage]
+        except KeyError:
             raise OSFNotFoundError("Project has no storage provider '{}'".format(storage),
-                                    status.HTTP_404_NOT_FOUND)
+                                   status.HTTP_404_NOT_FOUND)
 
     def get_all_files(self, initial_path, files, empty_containers):
-        for storage in self.storages():
-            storage.get_all_files('{}/{}/{}'.format(initial_path, self.title, storage.title), files, empty_containers)
+        """
+        Recursively gets all files for the project's storages and child projects.
+        The whole project tree is collected first and every storage is then walked in a single
+        bounded pool, since each walk is bound by its own OSF requests.
+        """
+        storage_walks = self._storage_walks(initial_path)
+
+        with ThreadPoolExecutor(max_workers=_MAX_WALK_WORKERS) as executor:
+            walk_results = executor.map(lambda walk: _walk_storage(*walk), storage_walks)
+            # Merge in tree order so the results match a serial walk
+            for storage_files, storage_empty_containers in walk_results:
+                files.extend(storage_files)
+                empty_containers.extend(storage_empty_containers)
+
+    def _storage_walks(self, initial_path):
+        """
+        Get the path and Storage object of every storage in this project and its child projects.
+
+        Parameters
+        ----------
+        initial_path : str
+            Path the project's title is appended to.
+
+        Returns
+        -------
+        List of (path, Storage) tuples in tree order.
+        """
+        storage_walks = [('{}/{}/{}'.format(initial_path, self.title, storage.title), storage)
+                         for storage in self.storages()]
 
         children_data = self._get_all_paginated_data(self.children_link)
         if children_data:
+            child_path = '{}/{}'.format(initial_path, self.title)
             for child_data in children_data:
-                child_project = Project(child_data, self.session)
-                child_project.get_all_files('{}/{}'.format(initial_path, self.title), files, empty_containers)
\ No newline at end of file
+                storage_walks.extend(
+                    Project(child_data, self.session)._storage_walks(child_path))
+        return storage_walks
+
+
+def _walk_storage(path, storage):
+    """
+    Get all files for a storage into lists owned by this walk.
+
+    Parameters
+    ----------
+    path : str
+        Path of the storage within the download.
+    storage : Storage
+        The Storage object to walk.
+
+    Returns
+    -------
+    Tuple of the storage's files list and empty containers list.
+    """
+    storage_files = []
+    storage_empty_containers = []
+    storage.get_all_files(path, storage_files, storage_empty_containers)
+    return storage_files, storage_empty_containers
@@ -6,7 +6,7 @@ from rest_framework import status
 
 from presqt.targets.osf.utilities import get_osf_resource, osf_download_metadata, extra_metadata_helper
 from presqt.utilities import (PresQTResponseException, PresQTInvalidTokenError,
-                              get_dictionary_from_list, update_process_info, increment_process_info,
+                              update_process_info, increment_process_info,
                               update_process_info_message)
 from presqt.targets.osf.classes.main import OSF
 
@@ -169,13 +169,13 @@ def osf_download_resource(token, resource_id, process_info_path, action):
         asyncio.set_event_loop(loop)
         download_data = loop.run_until_complete(async_main(file_urls, token, process_info_path, action))
 
+        downloads_by_url = {data['url']: data for data in download_data}
         # Go through the file dictionaries and replace the file class with the binary_content
         for file in files:
             file['source_path'] = '/{}/{}{}'.format(project.title,
                                                     file['file'].provider,
                                                     file['file'].materialized_path)
-            file['file'] = get_dictionary_from_list(
-                download_data, 'url', file['file'].download_url)['binary_content']
+            file['file'] = downloads_by_url[file['file'].download_url]['binary_content']
 
     return {
         'resources': files,
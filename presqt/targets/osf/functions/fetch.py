@@ -101,8 +101,9 @@ def osf_fetch_resources(token, query_parameter):
         # If page exists in url, then we are filtering the results so we don't have to worry
         # about parent and subprojects
         if 'page=' in url:
+            response_json = response.json()
             paginated_resources = []
-            for project in response.json()['data']:
+            for project in response_json['data']:
                 paginated_resources.append({
                     "kind": "container",
                     "kind_name": "project",
@@ -110,7 +111,7 @@ def osf_fetch_resources(token, query_parameter):
                     "container": None,
                     "title": project['attributes']['title'],
                 })
-            pages = get_search_page_numbers(url, token)
+            pages = get_search_page_numbers(url, token, response_json)
 
         # If 'page=' doesn't exist in the url then we are getting the user's first page of projects.
         # Since subprojects exist in the main nodes api endpoint we need to filter them out
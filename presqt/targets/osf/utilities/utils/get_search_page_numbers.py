@@ -1,7 +1,9 @@
-import requests
-import math
+from urllib.parse import parse_qs, urlparse
 
-def get_search_page_numbers(url, token):
+from presqt.targets.utilities.utils.session import get_shared_session
+
+
+def get_search_page_numbers(url, token, response_json=None):
     """
     Get the pagination information for the request.
     Parameters
@@ -10,25 +12,29 @@ def get_search_page_numbers(url, token):
         The OSF url
     token : str
         OSF authorization token
+    response_json : dict
+        The already fetched JSON for the url, if the caller has it
     Returns
     -------
     A dictionary of page numbers
     """
-    headers = {"Authorization": "Bearer {}".format(token)}
-    pagination_info = requests.get(url, headers=headers).json()['links']
+    if response_json is None:
+        headers = {"Authorization": "Bearer {}".format(token)}
+        response_json = get_shared_session().get(url, headers=headers).json()
+    pagination_info = response_json['links']
 
+    meta = pagination_info['meta']
     next_page = pagination_info['next']
     previous_page = pagination_info['prev']
 
     if next_page:
-        next_page = next_page.partition('page=')[2]
+        next_page = parse_qs(urlparse(next_page).query).get('page', [''])[0]
 
     if previous_page:
-        previous_page = previous_page.partition('page=')[2]
-        if previous_page == '':
-            previous_page = '1'
+        # OSF drops the page parameter from the link to the first page
+        previous_page = parse_qs(urlparse(previous_page).query).get('page', ['1'])[0]
 
-    total_pages = math.ceil(pagination_info['meta']['total']/pagination_info['meta']['per_page'])
+    total_pages = -(-meta['total'] // meta['per_page'])
 
     pages = {
         "first_page": '1',
@@ -36,6 +42,6 @@ def get_search_page_numbers(url, token):
         "next_page": next_page,
         "last_page": str(total_pages),
         "total_pages": str(total_pages),
-        "per_page": pagination_info['meta']['per_page']}
+        "per_page": meta['per_page']}
 
     return pages
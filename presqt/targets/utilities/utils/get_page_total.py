@@ -1,6 +1,3 @@
-import math
-
-
 def get_page_total(total_number, per_page_number):
     """
     Given a total page number and number of items per page, calculate the page total
@@ -16,4 +13,4 @@ def get_page_total(total_number, per_page_number):
     -------
     Integer representing the total number of pages
     """
-    return int(math.ceil(float(total_number)/per_page_number))
\ No newline at end of file
+    return -(-total_number // per_page_number)
\ No newline at end of file
@@ -1,5 +1,11 @@
+import os
+from http.cookiejar import DefaultCookiePolicy
+
 import requests
 
+_SHARED_SESSION = None
+_SHARED_SESSION_PID = None
+
 
 class PresQTSession(requests.Session):
     """
@@ -44,3 +50,25 @@ class PresQTSession(requests.Session):
         parts.extend(args)
         # canonical URLs end with a slash
         return '/'.join(parts) + '/'
+
+
+def get_shared_session():
+    """
+    Get a keep-alive session for one-off requests made from this process.
+    The session is shared between users, so auth headers must be passed per request and the
+    session never stores cookies. A new session is made after a fork so pooled connections are
+    never shared between processes.
+
+    Returns
+    -------
+    requests Session object
+    """
+    global _SHARED_SESSION, _SHARED_SESSION_PID
+
+    if _SHARED_SESSION is None or _SHARED_SESSION_PID != os.getpid():
+        session = requests.Session()
+        # Refuse cookies from every domain so one user's cookies are never sent for another
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        _SHARED_SESSION = session
+        _SHARED_SESSION_PID = os.getpid()
+    return _SHARED_SESSION
@@ -6,7 +6,7 @@ from rest_framework import status
 
 from presqt.targets.zenodo.utilities import (
     zenodo_download_helper, zenodo_validation_check, extra_metadata_helper)
-from presqt.utilities import (PresQTResponseException, get_dictionary_from_list,
+from presqt.utilities import (PresQTResponseException,
                               update_process_info,
                               increment_process_info, update_process_info_message)
 
@@ -185,10 +185,10 @@ def zenodo_download_resource(token, resource_id, process_info_path, action):
         download_data = loop.run_until_complete(async_main(
             file_urls, auth_parameter, process_info_path, action))
 
+        downloads_by_url = {data['url']: data for data in download_data}
         # Go through the file dictionaries and replace the file path with the binary_content
         for file in files:
-            file['file'] = get_dictionary_from_list(
-                download_data, 'url', file['file'])['binary_content']
+            file['file'] = downloads_by_url[file['file']]['binary_content']
 
     return {
         'resources': files,